@@ -11,15 +11,43 @@ Implements LSP for JOVIAL J73, enabling IDE features:
 - Diagnostics
 """
 
+import bisect
 import json
 import sys
+import threading
+from array import array
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
-from jovial_semantic_parser import JovialSemanticParser, JovialSemanticModel, JovialType
-
-
-@dataclass
+# orjson is substantially faster than stdlib json on both loads and dumps;
+# fall back to stdlib when it isn't installed. _dumps_bytes returns UTF-8
+# bytes so Content-Length can be computed without an extra encode pass.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps_bytes = orjson.dumps
+    _JSONDecodeError = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _dumps_bytes = lambda obj: json.dumps(obj).encode('utf-8')
+    _JSONDecodeError = (json.JSONDecodeError,)
+
+# pyahocorasick gives a DFA-based multi-pattern scan for find-references on
+# large files; without it the literal-scan path below is used.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from jovial_semantic_parser import JovialSemanticParser, JovialSemanticModel, JovialType, TYPE_STR
+
+# Completion sortText strings, precomputed so the hot loop does no per-item
+# formatting for typical result sizes
+_SORT_KEYS = [f'{i:04d}' for i in range(4096)]
+
+
+@dataclass(slots=True)
 class LSPPosition:
     """LSP position (line, character)"""
     line: int
@@ -33,7 +61,7 @@ class LSPPosition:
         return {'line': self.line, 'character': self.character}
 
 
-@dataclass
+@dataclass(slots=True)
 class LSPRange:
     """LSP range (start, end positions)"""
     start: LSPPosition
@@ -53,7 +81,7 @@ class LSPRange:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LSPLocation:
     """LSP location (URI + range)"""
     uri: str
@@ -72,44 +100,72 @@ class JovialLSPServer:
     Handles LSP requests and responses
     """
 
+    # Delay before parsing after a keystroke; coalesces bursts of didChange
+    PARSE_DEBOUNCE_SECONDS = 0.05
+
+    # Editors show only the top slice anyway; cap the payload and mark the
+    # result incomplete so the client re-queries as the prefix grows
+    MAX_COMPLETIONS = 200
+
     def __init__(self):
-        self.parser = JovialSemanticParser()
         self.documents: Dict[str, str] = {}  # URI -> document content
         self.models: Dict[str, JovialSemanticModel] = {}  # URI -> semantic model
+        self.parsers: Dict[str, JovialSemanticParser] = {}  # URI -> parser bound to model
+        self.lines_cache: Dict[str, List[str]] = {}  # URI -> split document lines
+        self.symbol_index: Dict[str, Dict[str, tuple]] = {}  # URI -> name -> (kind, payload)
+        self._line_starts: Dict[str, array] = {}  # URI -> offset of each line start
+        self._upper_text: Dict[str, str] = {}  # URI -> uppercased document text
+        self._ref_automata: Dict[str, Any] = {}  # URI -> Aho-Corasick automaton
+        self._doc_symbols_json: Dict[str, bytes] = {}  # URI -> serialized symbol array body
+        self._hover_md: Dict[str, Dict[str, str]] = {}  # URI -> symbol -> hover markdown
+        self._pos_index: Dict[str, List[tuple]] = {}  # URI -> (line_start, line_end, kind, name), sorted
+        self._pending_parse: Dict[str, threading.Timer] = {}  # URI -> debounce timer
+
+        # Separate dispatch tables so notifications (didChange fires per
+        # keystroke) take the shortest path: one hash lookup, no id or
+        # response handling
+        self._notify_dispatch = {
+            'textDocument/didOpen': self._handle_did_open,
+            'textDocument/didChange': self._handle_did_change,
+            'textDocument/didClose': self._handle_did_close,
+            'initialized': self._handle_noop_notification,
+            'exit': self._handle_noop_notification,
+        }
+        self._request_dispatch = {
+            'textDocument/completion': self._handle_completion,
+            'textDocument/hover': self._handle_hover,
+            'textDocument/definition': self._handle_definition,
+            'textDocument/references': self._handle_references,
+            'textDocument/documentSymbol': self._handle_document_symbol,
+        }
 
-    def handle_request(self, request: Dict) -> Optional[Dict]:
-        """Handle an LSP request"""
+    def handle_request(self, request: Dict) -> Optional[Any]:
+        """Handle an LSP request.
+
+        Returns a response dict, pre-serialized response bytes, or None
+        for notifications.
+        """
         method = request.get('method')
-        params = request.get('params', {})
+
+        handler = self._notify_dispatch.get(method)
+        if handler is not None:
+            handler(request.get('params', {}))
+            return None
+        if method is not None and method.startswith('$/') and 'id' not in request:
+            return None  # Optional protocol notifications ($/cancelRequest etc.)
+
         request_id = request.get('id')
+        handler = self._request_dispatch.get(method)
+        if handler is not None:
+            return handler(request_id, request.get('params', {}))
 
         if method == 'initialize':
             return self._handle_initialize(request_id)
-        elif method == 'initialized':
-            return None  # Notification
-        elif method == 'textDocument/didOpen':
-            self._handle_did_open(params)
-            return None
-        elif method == 'textDocument/didChange':
-            self._handle_did_change(params)
-            return None
-        elif method == 'textDocument/didClose':
-            self._handle_did_close(params)
-            return None
-        elif method == 'textDocument/completion':
-            return self._handle_completion(request_id, params)
-        elif method == 'textDocument/hover':
-            return self._handle_hover(request_id, params)
-        elif method == 'textDocument/definition':
-            return self._handle_definition(request_id, params)
-        elif method == 'textDocument/references':
-            return self._handle_references(request_id, params)
-        elif method == 'textDocument/documentSymbol':
-            return self._handle_document_symbol(request_id, params)
         elif method == 'shutdown':
             return {'jsonrpc': '2.0', 'id': request_id, 'result': None}
         else:
-            if request_id:
+            # 'id' may legitimately be 0, so test presence rather than truth
+            if 'id' in request:
                 return {
                     'jsonrpc': '2.0',
                     'id': request_id,
@@ -120,6 +176,9 @@ class JovialLSPServer:
                 }
             return None
 
+    def _handle_noop_notification(self, params: Dict):
+        """Notification that needs no work (initialized, exit)"""
+
     def _handle_initialize(self, request_id: Optional[int]) -> Dict:
         """Handle initialize request"""
         return {
@@ -129,7 +188,7 @@ class JovialLSPServer:
                 'capabilities': {
                     'textDocumentSync': {
                         'openClose': True,
-                        'change': 1  # Full sync
+                        'change': 2  # Incremental sync
                     },
                     'completionProvider': {
                         'triggerCharacters': [' ', "'", '.', '(']
@@ -158,18 +217,122 @@ class JovialLSPServer:
         uri = params['textDocument']['uri']
         changes = params['contentChanges']
 
-        if changes:
-            # Full sync - take last change
-            self.documents[uri] = changes[-1].get('text', '')
-            self._parse_document(uri)
+        if not changes:
+            return
+
+        old_text = self.documents.get(uri, '')
+        text = old_text
+        dirty = None  # (dirty_start, old_dirty_end, new_dirty_end)
+
+        # The cached line-start table only matches the document before any
+        # edits have been applied, so it is used for the first change only
+        line_starts = self._line_starts.get(uri)
+        for change in changes:
+            if 'range' in change:
+                text, dirty = self._apply_change(text, change['range'], change.get('text', ''),
+                                                 line_starts)
+            else:
+                # Full-sync fallback (client replaced the whole document)
+                text = change.get('text', '')
+                dirty = None
+            line_starts = None
+
+        self.documents[uri] = text
+        # Refresh the line-start table whenever the buffer changes, so the
+        # next didChange never splices against offsets from pre-edit text
+        # (a debounced parse leaves every other cache stale until it runs)
+        self._line_starts[uri] = self._compute_line_starts(text)
+
+        # Try an incremental reparse for a single range edit; anything more
+        # complex (or a failed attempt) falls back to a full parse. A
+        # pending debounced parse means models/lines_cache lag the buffer,
+        # so reparse would diff against the wrong baseline
+        if (dirty is not None and len(changes) == 1 and uri in self.models
+                and uri not in self._pending_parse):
+            parser = self.parsers.get(uri) or JovialSemanticParser()
+            old_lines = self.lines_cache.get(uri) or old_text.split('\n')
+            model = parser.reparse(
+                self.models[uri],
+                old_lines, text.split('\n'),
+                dirty[0], dirty[1], dirty[2]
+            )
+            if model is not None:
+                self.models[uri] = model
+                self.parsers[uri] = parser
+                self.lines_cache[uri] = parser.lines
+                self.symbol_index[uri] = self._build_symbol_index(parser, model)
+                self._build_reference_automaton(uri, model)
+                self._doc_symbols_json[uri] = self._build_document_symbols(uri, model)
+                self._upper_text[uri] = text.upper()
+                self._hover_md[uri] = self._build_hover_markdown(model)
+                self._pos_index[uri] = self._build_position_index(model)
+                return
+
+        self._schedule_parse(uri)
+
+    @classmethod
+    def _apply_change(cls, text: str, change_range: Dict, new_chunk: str,
+                      line_starts: Optional[array] = None):
+        """Apply an incremental TextDocumentContentChangeEvent to text"""
+        start = change_range['start']
+        end = change_range['end']
+
+        if line_starts is None:
+            line_starts = cls._compute_line_starts(text)
+
+        def offset_at(line: int, character: int) -> int:
+            if line >= len(line_starts):
+                return len(text)
+            return min(line_starts[line] + character, len(text))
+
+        start_offset = offset_at(start['line'], start['character'])
+        end_offset = offset_at(end['line'], end['character'])
+        new_text = text[:start_offset] + new_chunk + text[end_offset:]
+
+        dirty = (start['line'], end['line'], start['line'] + new_chunk.count('\n'))
+        return new_text, dirty
 
     def _handle_did_close(self, params: Dict):
         """Handle textDocument/didClose notification"""
         uri = params['textDocument']['uri']
+        timer = self._pending_parse.pop(uri, None)
+        if timer:
+            timer.cancel()
         if uri in self.documents:
             del self.documents[uri]
         if uri in self.models:
             del self.models[uri]
+        self.parsers.pop(uri, None)
+        self.lines_cache.pop(uri, None)
+        self.symbol_index.pop(uri, None)
+        self._line_starts.pop(uri, None)
+        self._ref_automata.pop(uri, None)
+        self._doc_symbols_json.pop(uri, None)
+        self._upper_text.pop(uri, None)
+        self._hover_md.pop(uri, None)
+        self._pos_index.pop(uri, None)
+
+    def _schedule_parse(self, uri: str):
+        """Defer parsing briefly so bursts of didChange coalesce into one parse"""
+        timer = self._pending_parse.pop(uri, None)
+        if timer:
+            timer.cancel()
+        timer = threading.Timer(self.PARSE_DEBOUNCE_SECONDS, self._run_scheduled_parse, args=(uri,))
+        timer.daemon = True
+        self._pending_parse[uri] = timer
+        timer.start()
+
+    def _run_scheduled_parse(self, uri: str):
+        """Timer callback for a debounced parse"""
+        self._pending_parse.pop(uri, None)
+        self._parse_document(uri)
+
+    def _flush_pending_parse(self, uri: str):
+        """Parse immediately if a debounced parse is still pending"""
+        timer = self._pending_parse.pop(uri, None)
+        if timer:
+            timer.cancel()
+            self._parse_document(uri)
 
     def _parse_document(self, uri: str):
         """Parse a document and build semantic model"""
@@ -177,13 +340,66 @@ class JovialLSPServer:
             return
 
         text = self.documents[uri]
-        parser = JovialSemanticParser()
+        # Reuse the document's parser; parse() resets it, so only the first
+        # parse of a URI pays object construction
+        parser = self.parsers.get(uri) or JovialSemanticParser()
         model = parser.parse(text)
         self.models[uri] = model
+        self.parsers[uri] = parser
+        self.lines_cache[uri] = parser.lines
+        self.symbol_index[uri] = self._build_symbol_index(parser, model)
+        self._line_starts[uri] = self._compute_line_starts(text)
+        self._build_reference_automaton(uri, model)
+        self._doc_symbols_json[uri] = self._build_document_symbols(uri, model)
+        self._upper_text[uri] = text.upper()
+        self._hover_md[uri] = self._build_hover_markdown(model)
+        self._pos_index[uri] = self._build_position_index(model)
+
+    def _build_reference_automaton(self, uri: str, model: JovialSemanticModel):
+        """Build a multi-pattern automaton over all symbol names (optional)"""
+        if ahocorasick is None:
+            return
+        automaton = ahocorasick.Automaton()
+        for name in model.get_all_symbols():
+            automaton.add_word(name.lower(), name)
+        automaton.make_automaton()
+        self._ref_automata[uri] = automaton
+
+    @staticmethod
+    def _compute_line_starts(text: str) -> array:
+        """Offsets of each line start, for offset -> (line, char) conversion"""
+        starts = array('i', [0])
+        idx = text.find('\n')
+        while idx != -1:
+            starts.append(idx + 1)
+            idx = text.find('\n', idx + 1)
+        return starts
+
+    @staticmethod
+    def _build_symbol_index(parser: JovialSemanticParser,
+                            model: JovialSemanticModel) -> Dict[str, tuple]:
+        """Build a name -> (kind, payload) map classifying every known symbol.
+
+        Merge order mirrors the old membership cascade: keywords shadow
+        procs, which shadow tables, items and defines.
+        """
+        index: Dict[str, tuple] = {}
+        for name, define in model.defines.items():
+            index[name] = ('define', define)
+        for name, item in model.items.items():
+            index[name] = ('item', item)
+        for name, table in model.tables.items():
+            index[name] = ('table', table)
+        for name, proc in model.procs.items():
+            index[name] = ('proc', proc)
+        for keyword in parser.KEYWORDS:
+            index[keyword] = ('keyword', None)
+        return index
 
     def _handle_completion(self, request_id: Optional[int], params: Dict) -> Dict:
         """Handle textDocument/completion request"""
         uri = params['textDocument']['uri']
+        self._flush_pending_parse(uri)
         position = LSPPosition.from_dict(params['position'])
 
         if uri not in self.models:
@@ -194,55 +410,57 @@ class JovialLSPServer:
             }
 
         model = self.models[uri]
-        parser = JovialSemanticParser()
-        parser.model = model
-        parser.lines = self.documents[uri].split('\n')
+        parser = self.parsers[uri]
 
         completions = parser.get_completions_at_position(position.line, position.character)
 
+        truncated = len(completions) > self.MAX_COMPLETIONS
+        if truncated:
+            completions = completions[:self.MAX_COMPLETIONS]
+
+        index = self.symbol_index.get(uri, {})
+
         items = []
         for i, completion in enumerate(completions):
-            # Determine kind based on what it is
+            # Classify with a single index lookup
+            kind_tag, payload = index.get(completion, (None, None))
             kind = 6  # Variable (default)
             detail = 'JOVIAL symbol'
 
-            if completion in parser.KEYWORDS:
+            if kind_tag == 'keyword':
                 kind = 14  # Keyword
                 detail = 'J73 keyword'
-            elif completion in model.procs:
+            elif kind_tag == 'proc':
                 kind = 3  # Function
-                proc = model.procs[completion]
-                params_str = ', '.join([p[0] for p in proc.parameters])
+                params_str = ', '.join([p[0] for p in payload.parameters])
                 detail = f'PROC ({params_str})'
-            elif completion in model.tables:
+            elif kind_tag == 'table':
                 kind = 7  # Class (for table/struct)
-                table = model.tables[completion]
-                dims = ', '.join([f"{d[0]}:{d[1]}" for d in table.dimensions])
+                dims = ', '.join([f"{d[0]}:{d[1]}" for d in payload.dimensions])
                 detail = f'TABLE ({dims})'
-            elif completion in model.items:
-                item = model.items[completion]
+            elif kind_tag == 'item':
                 kind = 6  # Variable
-                type_str = item.type.value
-                if item.size:
-                    type_str += f' {item.size}'
+                type_str = TYPE_STR[payload.type]
+                if payload.size:
+                    type_str += f' {payload.size}'
                 detail = f'ITEM {type_str}'
-            elif completion in model.defines:
+            elif kind_tag == 'define':
                 kind = 21  # Constant
-                detail = f'DEFINE = {model.defines[completion].value}'
+                detail = f'DEFINE = {payload.value}'
 
             items.append({
                 'label': completion,
                 'kind': kind,
                 'detail': detail,
                 'insertText': completion,
-                'sortText': f'{i:04d}'
+                'sortText': _SORT_KEYS[i] if i < 4096 else f'{i:04d}'
             })
 
         return {
             'jsonrpc': '2.0',
             'id': request_id,
             'result': {
-                'isIncomplete': False,
+                'isIncomplete': truncated,
                 'items': items
             }
         }
@@ -250,6 +468,7 @@ class JovialLSPServer:
     def _handle_hover(self, request_id: Optional[int], params: Dict) -> Dict:
         """Handle textDocument/hover request"""
         uri = params['textDocument']['uri']
+        self._flush_pending_parse(uri)
         position = LSPPosition.from_dict(params['position'])
 
         if uri not in self.models:
@@ -260,9 +479,7 @@ class JovialLSPServer:
             }
 
         model = self.models[uri]
-        parser = JovialSemanticParser()
-        parser.model = model
-        parser.lines = self.documents[uri].split('\n')
+        parser = self.parsers[uri]
 
         hover_info = parser.get_hover_info(position.line, position.character)
 
@@ -273,46 +490,17 @@ class JovialLSPServer:
                 'result': None
             }
 
-        # Build hover content in markdown
-        if hover_info['type'] == 'item':
-            content = f"**{hover_info['name']}** (ITEM)\n\n"
-            content += f"Type: `{hover_info['jovial_type']}`"
-            if hover_info.get('size'):
-                content += f" {hover_info['size']}"
-            content += "\n"
-            if hover_info.get('is_constant'):
-                content += "Attribute: `CONSTANT`\n"
-            if hover_info.get('is_static'):
-                content += "Attribute: `STATIC`\n"
-            if hover_info.get('status_values'):
-                content += f"Values: {', '.join(hover_info['status_values'])}\n"
-            if hover_info.get('initial_value'):
-                content += f"Initial: `{hover_info['initial_value']}`\n"
-            content += f"\nDefined at line {hover_info['line'] + 1}"
-
-        elif hover_info['type'] == 'table':
-            content = f"**{hover_info['name']}** (TABLE)\n\n"
-            content += f"Dimensions: `({hover_info['dimensions']})`\n"
-            if hover_info.get('wordsize'):
-                content += f"Word size: {hover_info['wordsize']}\n"
-            if hover_info.get('entries'):
-                content += f"\nEntries:\n"
-                for entry in hover_info['entries'][:10]:  # Limit display
-                    content += f"- {entry}\n"
-            content += f"\nLines {hover_info['line_start'] + 1}-{hover_info.get('line_end', hover_info['line_start']) + 1}"
-
-        elif hover_info['type'] == 'proc':
-            content = f"**{hover_info['name']}** (PROC)\n\n"
-            if hover_info.get('parameters'):
-                content += f"Parameters: `{hover_info['parameters']}`\n"
-            content += f"\nLines {hover_info['line_start'] + 1}-{hover_info.get('line_end', hover_info['line_start']) + 1}"
+        # Markdown for items/tables/procs is precomputed at parse time
+        content = None
+        if hover_info['type'] in ('item', 'table', 'proc'):
+            content = self._hover_md.get(uri, {}).get(hover_info['name'])
 
-        elif hover_info['type'] == 'keyword':
-            content = f"**{hover_info['name']}** (J73 Keyword)\n\n"
-            content += hover_info.get('description', '')
-
-        else:
-            content = str(hover_info)
+        if content is None:
+            if hover_info['type'] == 'keyword':
+                content = f"**{hover_info['name']}** (J73 Keyword)\n\n"
+                content += hover_info.get('description', '')
+            else:
+                content = str(hover_info)
 
         return {
             'jsonrpc': '2.0',
@@ -328,6 +516,7 @@ class JovialLSPServer:
     def _handle_definition(self, request_id: Optional[int], params: Dict) -> Dict:
         """Handle textDocument/definition request"""
         uri = params['textDocument']['uri']
+        self._flush_pending_parse(uri)
         position = LSPPosition.from_dict(params['position'])
 
         if uri not in self.models:
@@ -338,27 +527,25 @@ class JovialLSPServer:
             }
 
         model = self.models[uri]
-        parser = JovialSemanticParser()
-        parser.model = model
-        parser.lines = self.documents[uri].split('\n')
+        parser = self.parsers[uri]
 
         hover_info = parser.get_hover_info(position.line, position.character)
 
-        if not hover_info:
-            return {
-                'jsonrpc': '2.0',
-                'id': request_id,
-                'result': None
-            }
-
         # Get definition line
         def_line = None
-        if hover_info['type'] == 'item':
-            def_line = hover_info.get('line', 0)
-        elif hover_info['type'] == 'table':
-            def_line = hover_info.get('line_start', 0)
-        elif hover_info['type'] == 'proc':
-            def_line = hover_info.get('line_start', 0)
+        if hover_info:
+            if hover_info['type'] == 'item':
+                def_line = hover_info.get('line', 0)
+            elif hover_info['type'] == 'table':
+                def_line = hover_info.get('line_start', 0)
+            elif hover_info['type'] == 'proc':
+                def_line = hover_info.get('line_start', 0)
+        else:
+            # Not on an identifier; resolve the enclosing declaration via
+            # the position index (e.g. ctrl-click inside a TABLE body)
+            interval = self._symbol_interval_at(uri, position.line)
+            if interval is not None:
+                def_line = interval[0]
 
         if def_line is None:
             return {
@@ -367,23 +554,22 @@ class JovialLSPServer:
                 'result': None
             }
 
-        location = LSPLocation(
-            uri=uri,
-            range=LSPRange(
-                start=LSPPosition(line=def_line, character=0),
-                end=LSPPosition(line=def_line, character=100)
-            )
-        )
-
         return {
             'jsonrpc': '2.0',
             'id': request_id,
-            'result': location.to_dict()
+            'result': {
+                'uri': uri,
+                'range': {
+                    'start': {'line': def_line, 'character': 0},
+                    'end': {'line': def_line, 'character': 100}
+                }
+            }
         }
 
     def _handle_references(self, request_id: Optional[int], params: Dict) -> Dict:
         """Handle textDocument/references request"""
         uri = params['textDocument']['uri']
+        self._flush_pending_parse(uri)
         position = LSPPosition.from_dict(params['position'])
 
         if uri not in self.models:
@@ -394,9 +580,7 @@ class JovialLSPServer:
             }
 
         model = self.models[uri]
-        parser = JovialSemanticParser()
-        parser.model = model
-        parser.lines = self.documents[uri].split('\n')
+        parser = self.parsers[uri]
 
         hover_info = parser.get_hover_info(position.line, position.character)
 
@@ -407,24 +591,70 @@ class JovialLSPServer:
                 'result': []
             }
 
-        # Find all references
+        # Find all references with one pass over the whole buffer,
+        # translating match offsets to (line, char) via the line-start table
         references = []
         symbol_name = hover_info.get('name', '')
 
         if symbol_name:
             text = self.documents[uri]
-            lines = text.split('\n')
-
-            import re
-            pattern = re.compile(r'\b' + re.escape(symbol_name) + r'\b', re.IGNORECASE)
-
-            for i, line in enumerate(lines):
-                for match in pattern.finditer(line):
-                    ref_range = LSPRange(
-                        start=LSPPosition(line=i, character=match.start()),
-                        end=LSPPosition(line=i, character=match.end())
-                    )
-                    references.append(LSPLocation(uri=uri, range=ref_range).to_dict())
+            line_starts = self._line_starts.get(uri)
+            if line_starts is None:
+                line_starts = self._compute_line_starts(text)
+                self._line_starts[uri] = line_starts
+
+            automaton = self._ref_automata.get(uri)
+            if automaton is not None:
+                # DFA scan over the whole buffer; word boundaries checked
+                # against the neighbouring characters
+                needle = symbol_name.lower()
+                length = len(needle)
+                for end_index, name in automaton.iter(text.lower()):
+                    if name.lower() != needle:
+                        continue
+                    start_index = end_index - length + 1
+                    before = text[start_index - 1] if start_index > 0 else ''
+                    after = text[end_index + 1] if end_index + 1 < len(text) else ''
+                    if (before.isalnum() or before == '_' or
+                            after.isalnum() or after == '_'):
+                        continue
+                    line = bisect.bisect_right(line_starts, start_index) - 1
+                    col = start_index - line_starts[line]
+                    references.append({
+                        'uri': uri,
+                        'range': {
+                            'start': {'line': line, 'character': col},
+                            'end': {'line': line, 'character': col + length}
+                        }
+                    })
+            else:
+                # Literal scan over the uppercased buffer; JOVIAL
+                # identifiers need no regex escaping and case folding is
+                # done once per document instead of per character
+                buf_upper = self._upper_text.get(uri)
+                if buf_upper is None:
+                    buf_upper = text.upper()
+                    self._upper_text[uri] = buf_upper
+
+                needle = symbol_name.upper()
+                length = len(needle)
+                idx = buf_upper.find(needle)
+                while idx != -1:
+                    before = buf_upper[idx - 1] if idx > 0 else ''
+                    after_idx = idx + length
+                    after = buf_upper[after_idx] if after_idx < len(buf_upper) else ''
+                    if not (before.isalnum() or before == '_' or
+                            after.isalnum() or after == '_'):
+                        line = bisect.bisect_right(line_starts, idx) - 1
+                        col = idx - line_starts[line]
+                        references.append({
+                            'uri': uri,
+                            'range': {
+                                'start': {'line': line, 'character': col},
+                                'end': {'line': line, 'character': col + length}
+                            }
+                        })
+                    idx = buf_upper.find(needle, idx + 1)
 
         return {
             'jsonrpc': '2.0',
@@ -432,9 +662,14 @@ class JovialLSPServer:
             'result': references
         }
 
-    def _handle_document_symbol(self, request_id: Optional[int], params: Dict) -> Dict:
-        """Handle textDocument/documentSymbol request"""
+    def _handle_document_symbol(self, request_id: Optional[int], params: Dict) -> Any:
+        """Handle textDocument/documentSymbol request.
+
+        The serialized symbol array is precomputed at parse time, so on
+        the (common) cache-hit path this only splices in the request id.
+        """
         uri = params['textDocument']['uri']
+        self._flush_pending_parse(uri)
 
         if uri not in self.models:
             return {
@@ -443,37 +678,132 @@ class JovialLSPServer:
                 'result': []
             }
 
-        model = self.models[uri]
-        symbols = []
+        body = self._doc_symbols_json.get(uri)
+        if body is None:
+            body = self._build_document_symbols(uri, self.models[uri])
+            self._doc_symbols_json[uri] = body
+        return (b'{"jsonrpc":"2.0","id":' + _dumps_bytes(request_id) +
+                b',"result":[' + body + b']}')
+
+    @staticmethod
+    def _build_position_index(model: JovialSemanticModel) -> List[tuple]:
+        """Sorted (line_start, line_end, kind, name) intervals for all symbols"""
+        intervals = []
+        seen = set()
+        for item in model.items.values():
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            intervals.append((item.line_number, item.line_number, 'item', item.name))
+        for table in model.tables.values():
+            intervals.append((table.line_start, table.line_end or table.line_start,
+                              'table', table.name))
+        for proc in model.procs.values():
+            intervals.append((proc.line_start, proc.line_end or proc.line_start,
+                              'proc', proc.name))
+        intervals.sort()
+        return intervals
+
+    def _symbol_interval_at(self, uri: str, line: int) -> Optional[tuple]:
+        """Innermost symbol interval covering a line, via bisect"""
+        intervals = self._pos_index.get(uri)
+        if not intervals:
+            return None
+        idx = bisect.bisect_right(intervals, (line, float('inf'))) - 1
+        while idx >= 0:
+            interval = intervals[idx]
+            if interval[1] >= line:
+                return interval
+            idx -= 1
+        return None
+
+    @staticmethod
+    def _build_hover_markdown(model: JovialSemanticModel) -> Dict[str, str]:
+        """Precompute hover markdown for every item, table and proc.
+
+        Insertion order mirrors get_hover_info resolution: items shadow
+        tables, which shadow procs.
+        """
+        hover_md: Dict[str, str] = {}
+
+        for name, proc in model.procs.items():
+            params_str = ', '.join([f"{p[0]} ({p[1]})" for p in proc.parameters])
+            content = f"**{proc.name}** (PROC)\n\n"
+            if params_str:
+                content += f"Parameters: `{params_str}`\n"
+            content += f"\nLines {proc.line_start + 1}-{(proc.line_end or proc.line_start) + 1}"
+            hover_md[name] = content
+
+        for name, table in model.tables.items():
+            dim_str = ', '.join([f"{d[0]}:{d[1]}" for d in table.dimensions])
+            content = f"**{table.name}** (TABLE)\n\n"
+            content += f"Dimensions: `({dim_str})`\n"
+            if table.wordsize:
+                content += f"Word size: {table.wordsize}\n"
+            if table.entries:
+                content += f"\nEntries:\n"
+                for entry in list(table.entries.keys())[:10]:  # Limit display
+                    content += f"- {entry}\n"
+            content += f"\nLines {table.line_start + 1}-{(table.line_end or table.line_start) + 1}"
+            hover_md[name] = content
+
+        for name, item in model.items.items():
+            content = f"**{item.name}** (ITEM)\n\n"
+            content += f"Type: `{TYPE_STR[item.type]}`"
+            if item.size:
+                content += f" {item.size}"
+            content += "\n"
+            if item.is_constant:
+                content += "Attribute: `CONSTANT`\n"
+            if item.is_static:
+                content += "Attribute: `STATIC`\n"
+            if item.status_values:
+                content += f"Values: {', '.join(item.status_values)}\n"
+            if item.initial_value:
+                content += f"Initial: `{item.initial_value}`\n"
+            content += f"\nDefined at line {item.line_number + 1}"
+            hover_md[name] = content
+
+        return hover_md
+
+    @staticmethod
+    def _build_document_symbols(uri: str, model: JovialSemanticModel) -> bytes:
+        """Serialize the document's symbols as a JSON array body.
+
+        Symbols are serialized record-by-record rather than accumulated
+        as one big list of dicts and re-walked by the JSON encoder.
+        """
+        parts: List[bytes] = []
 
         # Symbol kinds:
         # 5 = Class, 6 = Method/Function, 13 = Variable, 14 = Constant
 
-        # Add items (top-level only)
+        # Add items from the model's SoA arrays (declaration order, deduped)
         seen_items = set()
-        for name, item in model.items.items():
-            if '.' in name or name in seen_items:
+        for name, line, col_start, col_end, kind, detail in zip(
+                model.items_names, model.items_lines, model.items_col_start,
+                model.items_col_end, model.items_kinds, model.items_details):
+            if name in seen_items:
                 continue
             seen_items.add(name)
 
-            kind = 14 if item.is_constant else 13  # Constant or Variable
-            symbols.append({
+            parts.append(_dumps_bytes({
                 'name': name,
                 'kind': kind,
                 'location': {
                     'uri': uri,
                     'range': {
-                        'start': {'line': item.line_number, 'character': item.column_start},
-                        'end': {'line': item.line_number, 'character': item.column_end}
+                        'start': {'line': line, 'character': col_start},
+                        'end': {'line': line, 'character': col_end}
                     }
                 },
-                'detail': f'{item.type.value} {item.size or ""}'.strip()
-            })
+                'detail': detail
+            }))
 
         # Add tables
         for name, table in model.tables.items():
             dims = ', '.join([f"{d[0]}:{d[1]}" for d in table.dimensions])
-            symbols.append({
+            parts.append(_dumps_bytes({
                 'name': name,
                 'kind': 5,  # Class
                 'location': {
@@ -484,12 +814,12 @@ class JovialLSPServer:
                     }
                 },
                 'detail': f'TABLE ({dims})'
-            })
+            }))
 
         # Add procs
         for name, proc in model.procs.items():
             params_str = ', '.join([p[0] for p in proc.parameters])
-            symbols.append({
+            parts.append(_dumps_bytes({
                 'name': name,
                 'kind': 6,  # Method/Function
                 'location': {
@@ -500,11 +830,11 @@ class JovialLSPServer:
                     }
                 },
                 'detail': f'PROC ({params_str})'
-            })
+            }))
 
         # Add defines
         for name, define in model.defines.items():
-            symbols.append({
+            parts.append(_dumps_bytes({
                 'name': name,
                 'kind': 14,  # Constant
                 'location': {
@@ -515,55 +845,58 @@ class JovialLSPServer:
                     }
                 },
                 'detail': f'DEFINE = {define.value}'
-            })
+            }))
 
-        return {
-            'jsonrpc': '2.0',
-            'id': request_id,
-            'result': symbols
-        }
+        return b','.join(parts)
 
 
 def main():
     """Main entry point for LSP server"""
     server = JovialLSPServer()
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+
+    # One reusable output buffer; header and body are appended in place so
+    # no per-response str/bytes concatenations are allocated
+    out_buf = bytearray()
+
+    def send(body: bytes):
+        out_buf.clear()
+        out_buf.extend(b"Content-Length: %d\r\n\r\n" % len(body))
+        out_buf.extend(body)
+        stdout.write(out_buf)
+        stdout.flush()
 
     while True:
         try:
-            # Read header
-            header = ""
+            # Read headers line by line until the blank separator line
+            content_length = 0
             while True:
-                char = sys.stdin.read(1)
-                if not char:
+                line = stdin.readline()
+                if not line:
                     return
-                header += char
-                if header.endswith('\r\n\r\n') or header.endswith('\n\n'):
-                    break
-
-            # Parse Content-Length header
-            content_length = 0
-            for line in header.split('\n'):
-                if line.lower().startswith('content-length:'):
-                    content_length = int(line.split(':')[1].strip())
+                if line in (b'\r\n', b'\n'):
                     break
+                if line[:15].lower() == b'content-length:':
+                    content_length = int(line.split(b':', 1)[1].strip())
 
             # Read message body
             if content_length > 0:
-                message = sys.stdin.read(content_length)
+                message = stdin.read(content_length)
                 if not message:
                     break
 
                 try:
-                    request = json.loads(message)
+                    request = _loads(message)
                     response = server.handle_request(request)
 
                     if response:
-                        response_json = json.dumps(response)
-                        response_text = f"Content-Length: {len(response_json)}\r\n\r\n{response_json}"
-                        sys.stdout.write(response_text)
-                        sys.stdout.flush()
+                        if isinstance(response, (bytes, bytearray)):
+                            send(response)
+                        else:
+                            send(_dumps_bytes(response))
 
-                except json.JSONDecodeError as e:
+                except _JSONDecodeError as e:
                     error_response = {
                         'jsonrpc': '2.0',
                         'error': {
@@ -571,10 +904,7 @@ def main():
                             'message': f'Parse error: {str(e)}'
                         }
                     }
-                    error_json = json.dumps(error_response)
-                    response_text = f"Content-Length: {len(error_json)}\r\n\r\n{error_json}"
-                    sys.stdout.write(response_text)
-                    sys.stdout.flush()
+                    send(_dumps_bytes(error_response))
 
                 except Exception as e:
                     error_response = {
@@ -584,10 +914,7 @@ def main():
                             'message': f'Internal error: {str(e)}'
                         }
                     }
-                    error_json = json.dumps(error_response)
-                    response_text = f"Content-Length: {len(error_json)}\r\n\r\n{error_json}"
-                    sys.stdout.write(response_text)
-                    sys.stdout.flush()
+                    send(_dumps_bytes(error_response))
 
         except Exception as e:
             sys.stderr.write(f"Fatal error: {str(e)}\n")
@@ -10,28 +10,80 @@ This parser builds a semantic model for JOVIAL J73 code, enabling:
 - Scope resolution for IDE features
 """
 
+import bisect
+import heapq
 import re
+import sys
+from array import array
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
-from enum import Enum
-
-
-class JovialType(Enum):
+from enum import IntEnum
+
+# numba is optional: when present, the comment scanner below is compiled
+# to native code; otherwise the compiled-regex path is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _comment_start(buf: bytes) -> int:
+        """Return the byte offset of the first " outside a closed '...' string, or -1
+
+        Same rule as _COMMENT_SWEEP_RE: an apostrophe only opens a string
+        when it is closed on the same line; otherwise (identifiers like
+        PILOT'NAME) it is an ordinary character.
+        """
+        i = 0
+        n = len(buf)
+        while i < n:
+            char = buf[i]
+            if char == 34:  # "
+                return i
+            if char == 39:  # ' -- skip a closed string, else ordinary char
+                j = i + 1
+                while j < n and buf[j] != 39:
+                    j += 1
+                if j < n:
+                    i = j + 1
+                    continue
+            i += 1
+        return -1
+
+
+class JovialType(IntEnum):
     """JOVIAL J73 data types"""
-    SIGNED = "S"           # Signed integer
-    UNSIGNED = "U"         # Unsigned integer
-    FLOAT = "F"            # Floating point
-    FIXED = "A"            # Fixed point (scaled)
-    BIT = "B"              # Bit string
-    CHARACTER = "C"        # Character string
-    STATUS = "STATUS"      # Enumeration
-    POINTER = "P"          # Pointer
-    TABLE = "TABLE"        # Table (array/struct)
-    ENTRY = "ENTRY"        # Table entry
-    UNKNOWN = "UNKNOWN"
-
-
-@dataclass
+    SIGNED = 1             # Signed integer
+    UNSIGNED = 2           # Unsigned integer
+    FLOAT = 3              # Floating point
+    FIXED = 4              # Fixed point (scaled)
+    BIT = 5                # Bit string
+    CHARACTER = 6          # Character string
+    STATUS = 7             # Enumeration
+    POINTER = 8            # Pointer
+    TABLE = 9              # Table (array/struct)
+    ENTRY = 10             # Table entry
+    UNKNOWN = 11
+
+
+# J73 spellings of the types above, for hover/outline display
+TYPE_STR: Dict[JovialType, str] = {
+    JovialType.SIGNED: "S",
+    JovialType.UNSIGNED: "U",
+    JovialType.FLOAT: "F",
+    JovialType.FIXED: "A",
+    JovialType.BIT: "B",
+    JovialType.CHARACTER: "C",
+    JovialType.STATUS: "STATUS",
+    JovialType.POINTER: "P",
+    JovialType.TABLE: "TABLE",
+    JovialType.ENTRY: "ENTRY",
+    JovialType.UNKNOWN: "UNKNOWN",
+}
+
+
+@dataclass(slots=True)
 class ItemDefinition:
     """Represents a JOVIAL ITEM (variable) declaration"""
     name: str
@@ -50,7 +102,7 @@ class ItemDefinition:
     parent_table: Optional[str] = None  # If item is within a table
 
 
-@dataclass
+@dataclass(slots=True)
 class TableDefinition:
     """Represents a JOVIAL TABLE declaration"""
     name: str
@@ -64,7 +116,7 @@ class TableDefinition:
     line_end: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcDefinition:
     """Represents a JOVIAL PROC (procedure) declaration"""
     name: str
@@ -79,7 +131,7 @@ class ProcDefinition:
     body_start: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CompoolReference:
     """Represents a COMPOOL reference"""
     name: str
@@ -89,7 +141,7 @@ class CompoolReference:
     line_number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DefineConstant:
     """Represents a DEFINE constant"""
     name: str
@@ -105,12 +157,30 @@ class JovialSemanticModel:
 
     def __init__(self):
         self.items: Dict[str, ItemDefinition] = {}
+        self._scopes: Dict[str, Dict[str, ItemDefinition]] = {"GLOBAL": {}}
         self.tables: Dict[str, TableDefinition] = {}
         self.procs: Dict[str, ProcDefinition] = {}
         self.compools: Dict[str, CompoolReference] = {}
         self.defines: Dict[str, DefineConstant] = {}
         self.types: Dict[str, Any] = {}  # User-defined TYPE declarations
 
+        # Structure-of-arrays mirror of item positions/outline data; kept in
+        # declaration order so the documentSymbol payload can be built from
+        # compact int arrays instead of touching every ItemDefinition
+        self.items_names: List[str] = []
+        self.items_lines: array = array('i')
+        self.items_col_start: array = array('i')
+        self.items_col_end: array = array('i')
+        self.items_kinds: array = array('i')  # LSP SymbolKind (13/14)
+        self.items_details: List[str] = []
+
+        # Sorted symbol names for prefix completion; rebuilt lazily after edits
+        self._sorted_symbols: List[str] = []
+        self._symbols_dirty: bool = True
+
+        # Bumped on every mutation so position-keyed caches can expire
+        self.version: int = 0
+
         self.current_scope: str = "GLOBAL"
         self.scope_stack: List[str] = []
         self.program_name: Optional[str] = None
@@ -119,23 +189,31 @@ class JovialSemanticModel:
     def add_item(self, item: ItemDefinition):
         """Add an item definition"""
         key = f"{self.current_scope}.{item.name}" if self.current_scope != "GLOBAL" else item.name
-        self.items[item.name] = item
         self.items[key] = item
+        self._scopes.setdefault(self.current_scope, {})[item.name] = item
+
+        self.items_names.append(item.name)
+        self.items_lines.append(item.line_number)
+        self.items_col_start.append(item.column_start)
+        self.items_col_end.append(item.column_end)
+        self.items_kinds.append(14 if item.is_constant else 13)  # Constant or Variable
+        self.items_details.append(f'{TYPE_STR[item.type]} {item.size or ""}'.strip())
+        self._symbols_dirty = True
+        self.version += 1
 
     def get_item(self, name: str) -> Optional[ItemDefinition]:
         """Get item by name, checking scopes"""
-        # Check current scope first
-        scoped_name = f"{self.current_scope}.{name}"
-        if scoped_name in self.items:
-            return self.items[scoped_name]
-        # Check global
-        if name in self.items:
-            return self.items[name]
-        return None
+        # Check current scope first, then fall back to global
+        item = self._scopes.get(self.current_scope, {}).get(name)
+        if item is not None:
+            return item
+        return self._scopes["GLOBAL"].get(name)
 
     def add_table(self, table: TableDefinition):
         """Add a table definition"""
         self.tables[table.name] = table
+        self._symbols_dirty = True
+        self.version += 1
 
     def get_table(self, name: str) -> Optional[TableDefinition]:
         """Get table by name"""
@@ -144,6 +222,14 @@ class JovialSemanticModel:
     def add_proc(self, proc: ProcDefinition):
         """Add a procedure definition"""
         self.procs[proc.name] = proc
+        self._symbols_dirty = True
+        self.version += 1
+
+    def add_define(self, define: DefineConstant):
+        """Add a DEFINE constant"""
+        self.defines[define.name] = define
+        self._symbols_dirty = True
+        self.version += 1
 
     def get_proc(self, name: str) -> Optional[ProcDefinition]:
         """Get procedure by name"""
@@ -151,12 +237,95 @@ class JovialSemanticModel:
 
     def get_all_symbols(self) -> List[str]:
         """Get all symbol names for completion"""
-        symbols = []
-        symbols.extend(self.items.keys())
-        symbols.extend(self.tables.keys())
-        symbols.extend(self.procs.keys())
-        symbols.extend(self.defines.keys())
-        return list(set(symbols))
+        symbols = set()
+        for scope in self._scopes.values():
+            symbols.update(scope)
+        symbols.update(self.tables)
+        symbols.update(self.procs)
+        symbols.update(self.defines)
+        return list(symbols)
+
+    def sorted_symbols(self) -> List[str]:
+        """All symbol names sorted case-insensitively, rebuilt lazily"""
+        if self._symbols_dirty:
+            self._sorted_symbols = sorted(set(self.get_all_symbols()), key=str.upper)
+            self._symbols_dirty = False
+        return self._sorted_symbols
+
+    def remove_definitions_in_lines(self, line_start: int, line_end: int):
+        """Remove definitions declared within a line range (inclusive)"""
+        for key in [k for k, v in self.items.items()
+                    if line_start <= v.line_number <= line_end]:
+            del self.items[key]
+        for scope in self._scopes.values():
+            for key in [k for k, v in scope.items()
+                        if line_start <= v.line_number <= line_end]:
+                del scope[key]
+        keep = [i for i, line in enumerate(self.items_lines)
+                if not (line_start <= line <= line_end)]
+        if len(keep) != len(self.items_lines):
+            self.items_names = [self.items_names[i] for i in keep]
+            self.items_lines = array('i', (self.items_lines[i] for i in keep))
+            self.items_col_start = array('i', (self.items_col_start[i] for i in keep))
+            self.items_col_end = array('i', (self.items_col_end[i] for i in keep))
+            self.items_kinds = array('i', (self.items_kinds[i] for i in keep))
+            self.items_details = [self.items_details[i] for i in keep]
+        for key in [k for k, v in self.defines.items()
+                    if line_start <= v.line_number <= line_end]:
+            del self.defines[key]
+        for key in [k for k, v in self.types.items()
+                    if line_start <= v['line'] <= line_end]:
+            del self.types[key]
+        self._symbols_dirty = True
+        self.version += 1
+
+    def sort_items_by_line(self):
+        """Restore line order in the SoA mirror after an incremental reparse
+
+        Reparsed items are re-appended at the end of the arrays, which
+        would make the documentSymbol outline jump on every edit.
+        """
+        order = sorted(range(len(self.items_lines)), key=self.items_lines.__getitem__)
+        if any(i != j for i, j in enumerate(order)):
+            self.items_names = [self.items_names[i] for i in order]
+            self.items_lines = array('i', (self.items_lines[i] for i in order))
+            self.items_col_start = array('i', (self.items_col_start[i] for i in order))
+            self.items_col_end = array('i', (self.items_col_end[i] for i in order))
+            self.items_kinds = array('i', (self.items_kinds[i] for i in order))
+            self.items_details = [self.items_details[i] for i in order]
+
+    def shift_lines(self, after_line: int, delta: int):
+        """Shift all recorded line numbers beyond after_line by delta"""
+        if delta == 0:
+            return
+        self.version += 1
+        for item in self.items.values():
+            if item.line_number > after_line:
+                item.line_number += delta
+        for i, line in enumerate(self.items_lines):
+            if line > after_line:
+                self.items_lines[i] = line + delta
+        for table in self.tables.values():
+            if table.line_start > after_line:
+                table.line_start += delta
+            if table.line_end > after_line:
+                table.line_end += delta
+        for proc in self.procs.values():
+            if proc.line_start > after_line:
+                proc.line_start += delta
+            if proc.line_end > after_line:
+                proc.line_end += delta
+            if proc.body_start > after_line:
+                proc.body_start += delta
+        for define in self.defines.values():
+            if define.line_number > after_line:
+                define.line_number += delta
+        for type_info in self.types.values():
+            if type_info['line'] > after_line:
+                type_info['line'] += delta
+        for compool in self.compools.values():
+            if compool.line_number > after_line:
+                compool.line_number += delta
 
 
 class JovialSemanticParser:
@@ -165,7 +334,7 @@ class JovialSemanticParser:
     """
 
     # J73 Keywords
-    KEYWORDS = {
+    KEYWORDS = frozenset({
         # Module structure
         'START', 'TERM', 'BEGIN', 'END', 'COMPOOL', 'PROGRAM',
         # Declarations
@@ -185,11 +354,104 @@ class JovialSemanticParser:
         'FIRST', 'LAST', 'LBOUND', 'HBOUND', 'NENT', 'NWDSEN', 'BITSIZE', 'BYTESIZE', 'WORDSIZE',
         # I/O
         'INPUT', 'OUTPUT', 'OPEN', 'CLOSE',
+    })
+
+    # Keyword hover text, built once rather than per request
+    _KEYWORD_DESCRIPTIONS: Dict[str, str] = {
+        'START': 'Begin main program module',
+        'TERM': 'End program module',
+        'BEGIN': 'Begin block',
+        'END': 'End block',
+        'COMPOOL': 'Communication pool module (shared data)',
+        'ITEM': 'Scalar variable declaration',
+        'TABLE': 'Array/structure declaration',
+        'PROC': 'Procedure declaration',
+        'TYPE': 'User-defined type declaration',
+        'DEFINE': 'Compile-time constant',
+        'DEF': 'Import from COMPOOL',
+        'REF': 'Reference to external',
+        'S': 'Signed integer type',
+        'U': 'Unsigned integer type',
+        'F': 'Floating-point type',
+        'A': 'Fixed-point (scaled) type',
+        'B': 'Bit string type',
+        'C': 'Character string type',
+        'P': 'Pointer type',
+        'STATUS': 'Enumeration type',
+        'STATIC': 'Static allocation (persistent)',
+        'CONSTANT': 'Read-only value',
+        'PARALLEL': 'Parallel allocation for bit-packing',
+        'IF': 'Conditional statement',
+        'FOR': 'Counted loop',
+        'WHILE': 'Conditional loop (test before)',
+        'UNTIL': 'Conditional loop (test after)',
+        'CASE': 'Multi-way branch',
+        'GOTO': 'Unconditional branch',
+        'RETURN': 'Return from procedure',
+        'EXIT': 'Exit from loop',
+        'ABORT': 'Abort program execution',
+        'LOC': 'Location (address) function',
+        'NEXT': 'Next value in sequence',
+        'BIT': 'Bit extraction function',
+        'BYTE': 'Byte extraction function',
+        'SHIFTL': 'Shift left',
+        'SHIFTR': 'Shift right',
     }
 
+    # Presorted keywords so completion can bisect a prefix range
+    SORTED_KEYWORDS = sorted(KEYWORDS)
+
+    # Block markers that terminate a statement without a semicolon; all are
+    # at most 5 chars, so a length guard skips the upper() for normal lines
+    _BLOCK_KW = frozenset({'BEGIN', 'END', 'START', 'TERM'})
+
+    # Entries kept in the per-position hover/completion caches
+    POSITION_CACHE_SIZE = 256
+
     # Status value pattern V(name)
     STATUS_VALUE_PATTERN = re.compile(r"V\s*\(\s*([A-Z][A-Z0-9']*)\s*\)", re.IGNORECASE)
 
+    # Declaration patterns, compiled once at class scope so the per-statement
+    # handlers skip the re-module cache lookup on every match. They are
+    # case-sensitive and run against the uppercased statement (faster than
+    # IGNORECASE); original-case text is recovered through match spans.
+    _START_RE = re.compile(r'START\s+([A-Z][A-Z0-9\']*)?')
+    _COMPOOL_RE = re.compile(r'COMPOOL\s+([A-Z][A-Z0-9\']*)')
+    _ITEM_RE = re.compile(
+        r'ITEM\s+([A-Z][A-Z0-9\']*)\s+'
+        r'(STATIC\s+|CONSTANT\s+|PARALLEL\s+)*'
+        r'(S|U|F|A|B|C|P|STATUS)\s*'
+        r'(\d+)?'
+        r'(.*)'
+    )
+    _TABLE_RE = re.compile(
+        r'TABLE\s+([A-Z][A-Z0-9\']*)\s*'
+        r'\(([^)]+)\)\s*'
+        r'(.*)'
+    )
+    _PROC_RE = re.compile(
+        r'PROC\s+([A-Z][A-Z0-9\']*)\s*'
+        r'(?:\(([^)]*)\))?\s*'
+        r'(.*)'
+    )
+    _TYPE_RE = re.compile(r'TYPE\s+([A-Z][A-Z0-9\']*)\s+(.+)')
+    _DEFINE_RE = re.compile(r'DEFINE\s+([A-Z][A-Z0-9\']*)\s*=?\s*(.+)')
+    _DEF_RE = re.compile(r'DEF\s+(ITEM|TABLE|PROC)?\s*([A-Z][A-Z0-9\']*)')
+    _REF_RE = re.compile(r'REF\s+(ITEM|TABLE|PROC)?\s*([A-Z][A-Z0-9\']*)')
+    _VALUE_RE = re.compile(r'=\s*(.+)$')
+    # One table dimension: optional lower bound, optional :upper bound
+    _DIM_RE = re.compile(r'\s*(-?\d+)?\s*(?:(:)\s*(-?\d+)?)?')
+    # Comment rule shared by every stripping path: keep closed '...'
+    # strings, drop " to end of line. parse() applies it to the whole
+    # buffer in one C-level sweep; _remove_comments per line.
+    _COMMENT_SWEEP_RE = re.compile(r"('[^'\n]*')|\"[^\n]*")
+    _W_ATTR_RE = re.compile(r'W\s+(\d+)')
+
+    # Statements that open/close blocks or change module structure; edits
+    # touching these force a full reparse rather than an incremental one
+    STRUCTURAL_PATTERN = re.compile(
+        r'\s*(TABLE|PROC|BEGIN|END|START|TERM|COMPOOL|DEF|REF)\b', re.IGNORECASE)
+
     def __init__(self):
         self.model = JovialSemanticModel()
         self.lines: List[str] = []
@@ -202,142 +464,257 @@ class JovialSemanticParser:
         self.current_proc: Optional[str] = None
         self.in_compool = False
 
-    def parse(self, jovial_code: str) -> JovialSemanticModel:
-        """
-        Parse JOVIAL code and return semantic model
-        """
+        # Position-keyed caches; entries expire via the model version key
+        self._hover_cache: Dict[Tuple[int, int, int], Optional[Dict]] = {}
+        self._completion_cache: Dict[Tuple[int, int, int], List[str]] = {}
+
+        # Statement dispatch keyed by first token; one dict probe replaces
+        # the chain of startswith tests on the hottest parse path
+        self._statement_dispatch = {
+            'START': self._parse_start,
+            'TERM': lambda statement, upper, line_num: None,  # End of module
+            'COMPOOL': self._parse_compool_start,
+            'BEGIN': lambda statement, upper, line_num: self._handle_begin(line_num),
+            'END': lambda statement, upper, line_num: self._handle_end(line_num),
+            'ITEM': self._parse_item_declaration,
+            'TABLE': self._parse_table_declaration,
+            'PROC': self._parse_proc_declaration,
+            'TYPE': self._parse_type_declaration,
+            'DEFINE': self._parse_define,
+            'DEF': self._parse_def_reference,
+            'REF': self._parse_ref_reference,
+        }
+
+    def reset(self):
+        """Clear the model and per-parse state so the parser can be reused"""
         self.model = JovialSemanticModel()
-        self.lines = jovial_code.split('\n')
+        self.lines = []
         self.current_line_num = 0
-
-        # Reset state
         self.in_table_body = False
         self.current_table = None
         self.in_proc_body = False
         self.current_proc = None
         self.in_compool = False
+        self._hover_cache.clear()
+        self._completion_cache.clear()
+
+    def parse(self, jovial_code: str,
+              reuse_model: Optional[JovialSemanticModel] = None) -> JovialSemanticModel:
+        """
+        Parse JOVIAL code and return semantic model
 
-        # Multi-line statement buffer
-        statement_buffer = ""
+        When reuse_model (this parser's model from the previous parse) is
+        given, the edit is located by diffing against the previous lines
+        and routed through reparse() so untouched definitions are kept
+        rather than rebuilt. Falls back to a full parse when the edit
+        touches block structure.
+        """
+        if reuse_model is not None:
+            model = self._parse_incremental(jovial_code, reuse_model)
+            if model is not None:
+                return model
+
+        # split('\n') (not splitlines) keeps the trailing empty line of a
+        # newline-terminated file, matching the server's line cache and
+        # keeping completion usable on the last line
+        self.reset()
+        self.lines = jovial_code.split('\n')
 
-        for i, line in enumerate(self.lines):
-            self.current_line_num = i
+        # Remove comments ($ to end of line in J73, or " quoted comments)
+        # for the whole buffer at once; the sweep never consumes newlines,
+        # so line numbering is unchanged
+        if '"' in jovial_code:
+            code_lines = self._COMMENT_SWEEP_RE.sub(
+                lambda m: m.group(1) or '', jovial_code).split('\n')
+        else:
+            code_lines = self.lines
+
+        # Multi-line statement buffer, joined only when a statement completes
+        statement_buffer: List[str] = []
 
-            # Remove comments ($ to end of line in J73, or " quoted comments)
-            line = self._remove_comments(line)
+        for i, line in enumerate(code_lines):
+            self.current_line_num = i
 
             stripped = line.strip()
             if not stripped:
                 continue
 
             # Accumulate multi-line statements (until semicolon)
-            statement_buffer += " " + stripped
+            statement_buffer.append(stripped)
 
             # Check if statement is complete (ends with semicolon or is a block marker)
-            if stripped.endswith(';') or stripped.upper() in ('BEGIN', 'END', 'START', 'TERM'):
-                self._parse_statement(statement_buffer.strip(), i)
-                statement_buffer = ""
+            if stripped.endswith(';') or (len(stripped) <= 5 and stripped.upper() in self._BLOCK_KW):
+                self._parse_statement(' '.join(statement_buffer), i)
+                statement_buffer.clear()
 
         return self.model
 
+    def _parse_incremental(self, jovial_code: str,
+                           model: JovialSemanticModel) -> Optional[JovialSemanticModel]:
+        """Diff against the previous parse's lines and reparse the edit"""
+        old_lines = self.lines
+        if not old_lines:
+            return None
+        new_lines = jovial_code.split('\n')
+        if new_lines == old_lines:
+            return model
+
+        # Locate the dirty region as the common prefix/suffix of the line lists
+        limit = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        max_suffix = limit - prefix
+        while suffix < max_suffix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+
+        old_dirty_end = len(old_lines) - 1 - suffix
+        new_dirty_end = len(new_lines) - 1 - suffix
+        dirty_start = min(prefix, old_dirty_end, new_dirty_end)
+        if dirty_start < 0:
+            return None
+        return self.reparse(model, old_lines, new_lines,
+                            dirty_start, old_dirty_end, new_dirty_end)
+
+    def reparse(self, model: JovialSemanticModel, old_lines: List[str],
+                new_lines: List[str], dirty_start: int, old_dirty_end: int,
+                new_dirty_end: int) -> Optional[JovialSemanticModel]:
+        """
+        Incrementally update a semantic model after an edit.
+
+        The dirty region is widened to statement boundaries, stale
+        definitions in it are dropped, line numbers after it are shifted,
+        and only the region's statements are re-run through the statement
+        parser. Returns the updated model, or None when the edit touches
+        block structure (TABLE/PROC/BEGIN/END/...) and a full parse is
+        required.
+        """
+        delta = new_dirty_end - old_dirty_end
+
+        def is_boundary(line: str) -> bool:
+            stripped = self._remove_comments(line).strip()
+            return stripped.endswith(';') or (len(stripped) <= 5 and stripped.upper() in self._BLOCK_KW)
+
+        # Widen to the start of the statement containing the first dirty line
+        region_start = dirty_start
+        while region_start > 0 and not is_boundary(new_lines[region_start - 1]):
+            region_start -= 1
+
+        # Widen to the end of the statement containing the last dirty line
+        region_new_end = new_dirty_end
+        while region_new_end < len(new_lines) and not is_boundary(new_lines[region_new_end]):
+            region_new_end += 1
+        region_new_end = min(region_new_end, len(new_lines) - 1)
+        region_old_end = min(region_new_end - delta, len(old_lines) - 1)
+
+        # Bail out to a full parse when the edit touches block structure
+        for line in old_lines[region_start:region_old_end + 1]:
+            if self.STRUCTURAL_PATTERN.match(self._remove_comments(line)):
+                return None
+        for line in new_lines[region_start:region_new_end + 1]:
+            if self.STRUCTURAL_PATTERN.match(self._remove_comments(line)):
+                return None
+
+        # ... or falls inside a TABLE/PROC body, whose scope we can't reseed
+        for table in model.tables.values():
+            if table.line_start <= region_old_end and (table.line_end or table.line_start) >= region_start:
+                return None
+        for proc in model.procs.values():
+            if proc.line_start <= region_old_end and (proc.line_end or proc.line_start) >= region_start:
+                return None
+
+        # Drop stale definitions, shift everything after the region, then
+        # re-run only the region's statements at global scope
+        model.remove_definitions_in_lines(region_start, region_old_end)
+        model.shift_lines(region_old_end, delta)
+
+        self.model = model
+        self.lines = new_lines
+        self.in_table_body = False
+        self.current_table = None
+        self.in_proc_body = False
+        self.current_proc = None
+        self.in_compool = False
+
+        statement_buffer: List[str] = []
+        for i in range(region_start, region_new_end + 1):
+            self.current_line_num = i
+            line = self._remove_comments(new_lines[i])
+            stripped = line.strip()
+            if not stripped:
+                continue
+            statement_buffer.append(stripped)
+            if stripped.endswith(';') or (len(stripped) <= 5 and stripped.upper() in self._BLOCK_KW):
+                self._parse_statement(' '.join(statement_buffer), i)
+                statement_buffer.clear()
+
+        model.sort_items_by_line()
+        return model
+
     def _remove_comments(self, line: str) -> str:
         """Remove J73 comments from a line"""
-        # Inline comments start with "
-        # Also $ can be comment in some contexts
-        result = []
-        in_string = False
-        in_comment = False
-
-        for i, char in enumerate(line):
-            if in_comment:
-                # Comment to end of line
-                break
-            elif char == '"' and not in_string:
-                # Start of comment
-                in_comment = True
-            elif char == "'" and not in_comment:
-                # Toggle string mode
-                in_string = not in_string
-                result.append(char)
-            else:
-                result.append(char)
-
-        return ''.join(result)
+        # Inline comments start with " (outside closed '...' strings);
+        # same rule as the whole-buffer sweep used by parse(), so the
+        # incremental and full-parse paths agree on statement boundaries
+        if '"' not in line:
+            return line
+        if "'" not in line:
+            # No strings on the line, so the first " opens the comment
+            return line[:line.index('"')]
+        if njit is not None:
+            buf = line.encode('utf-8')
+            start = _comment_start(buf)
+            return buf[:start].decode('utf-8') if start >= 0 else line
+        return self._COMMENT_SWEEP_RE.sub(lambda m: m.group(1) or '', line)
 
     def _parse_statement(self, statement: str, line_num: int):
         """Parse a complete statement"""
         upper = statement.upper()
+        space = upper.find(' ')
+        token = upper[:space] if space != -1 else upper
+        handler = self._statement_dispatch.get(token)
+        if handler:
+            handler(statement, upper, line_num)
 
-        # Module structure
-        if upper.startswith('START'):
-            self._parse_start(statement, line_num)
-        elif upper.startswith('TERM'):
-            pass  # End of module
-        elif upper.startswith('COMPOOL'):
-            self._parse_compool_start(statement, line_num)
-        elif upper == 'BEGIN':
-            self._handle_begin(line_num)
-        elif upper == 'END':
-            self._handle_end(line_num)
-
-        # Declarations
-        elif upper.startswith('ITEM'):
-            self._parse_item_declaration(statement, line_num)
-        elif upper.startswith('TABLE'):
-            self._parse_table_declaration(statement, line_num)
-        elif upper.startswith('PROC'):
-            self._parse_proc_declaration(statement, line_num)
-        elif upper.startswith('TYPE'):
-            self._parse_type_declaration(statement, line_num)
-        elif upper.startswith('DEFINE'):
-            self._parse_define(statement, line_num)
-        elif upper.startswith('DEF') and not upper.startswith('DEFINE'):
-            self._parse_def_reference(statement, line_num)
-        elif upper.startswith('REF'):
-            self._parse_ref_reference(statement, line_num)
-
-    def _parse_start(self, statement: str, line_num: int):
+    def _parse_start(self, statement: str, upper: str, line_num: int):
         """Parse START statement"""
         # START [program-name]
-        match = re.match(r'START\s+([A-Z][A-Z0-9\']*)?', statement, re.IGNORECASE)
+        match = self._START_RE.match(upper)
         if match and match.group(1):
-            self.model.program_name = match.group(1)
+            self.model.program_name = sys.intern(statement[match.start(1):match.end(1)])
         self.model.module_type = "MAIN"
 
-    def _parse_compool_start(self, statement: str, line_num: int):
+    def _parse_compool_start(self, statement: str, upper: str, line_num: int):
         """Parse COMPOOL module start"""
-        match = re.match(r'COMPOOL\s+([A-Z][A-Z0-9\']*)', statement, re.IGNORECASE)
+        match = self._COMPOOL_RE.match(upper)
         if match:
-            self.model.program_name = match.group(1)
+            self.model.program_name = sys.intern(statement[match.start(1):match.end(1)])
             self.model.module_type = "COMPOOL"
         self.in_compool = True
 
-    def _parse_item_declaration(self, statement: str, line_num: int):
+    def _parse_item_declaration(self, statement: str, upper: str, line_num: int):
         """Parse ITEM declaration"""
         # Patterns:
         # ITEM name S [size] [= value];
         # ITEM name STATUS (V(a), V(b), ...);
         # ITEM name type [attributes] [= value];
 
-        # Remove trailing semicolon
+        # Remove trailing semicolon; upper() preserves length, so match
+        # spans against the uppercased form index into stmt directly
         stmt = statement.rstrip(';').strip()
 
         # Basic pattern: ITEM name type-spec [attributes]
-        match = re.match(
-            r'ITEM\s+([A-Z][A-Z0-9\']*)\s+'
-            r'(STATIC\s+|CONSTANT\s+|PARALLEL\s+)*'
-            r'(S|U|F|A|B|C|P|STATUS)\s*'
-            r'(\d+)?'
-            r'(.*)',
-            stmt, re.IGNORECASE
-        )
+        match = self._ITEM_RE.match(upper.rstrip(';').strip())
 
         if match:
-            name = match.group(1)
-            attrs = match.group(2) or ""
-            type_abbrev = match.group(3).upper()
+            # Intern names: the same identifier recurs across scopes and
+            # references, and interning makes dict-key compares pointer checks
+            name = sys.intern(stmt[match.start(1):match.end(1)])
+            attrs_upper = match.group(2) or ""
+            type_abbrev = match.group(3)
             size = int(match.group(4)) if match.group(4) else None
-            rest = match.group(5) or ""
+            rest = stmt[match.start(5):] if match.group(5) else ""
 
             # Map type abbreviation to enum
             type_map = {
@@ -360,7 +737,7 @@ class JovialSemanticParser:
 
             # Parse initial value if present
             initial_value = None
-            value_match = re.search(r'=\s*(.+)$', rest)
+            value_match = self._VALUE_RE.search(rest)
             if value_match:
                 initial_value = value_match.group(1).strip()
 
@@ -370,13 +747,13 @@ class JovialSemanticParser:
                 type=item_type,
                 size=size,
                 status_values=status_values,
-                is_constant='CONSTANT' in attrs.upper(),
-                is_static='STATIC' in attrs.upper(),
-                is_parallel='PARALLEL' in attrs.upper(),
+                is_constant='CONSTANT' in attrs_upper,
+                is_static='STATIC' in attrs_upper,
+                is_parallel='PARALLEL' in attrs_upper,
                 initial_value=initial_value,
                 line_number=line_num,
-                column_start=statement.upper().find(name),
-                column_end=statement.upper().find(name) + len(name),
+                column_start=match.start(1),
+                column_end=match.end(1),
                 parent_table=self.current_table
             )
 
@@ -392,7 +769,7 @@ class JovialSemanticParser:
 
             self.model.add_item(item)
 
-    def _parse_table_declaration(self, statement: str, line_num: int):
+    def _parse_table_declaration(self, statement: str, upper: str, line_num: int):
         """Parse TABLE declaration"""
         # TABLE name (bounds) [attributes];
         # TABLE name (lower:upper, lower:upper) [W size];
@@ -400,45 +777,38 @@ class JovialSemanticParser:
         stmt = statement.rstrip(';').strip()
 
         # Match table header
-        match = re.match(
-            r'TABLE\s+([A-Z][A-Z0-9\']*)\s*'
-            r'\(([^)]+)\)\s*'
-            r'(.*)',
-            stmt, re.IGNORECASE
-        )
+        match = self._TABLE_RE.match(upper.rstrip(';').strip())
 
         if match:
-            name = match.group(1)
+            name = sys.intern(stmt[match.start(1):match.end(1)])
             dims_str = match.group(2)
-            attrs = match.group(3) or ""
+            attrs_upper = match.group(3) or ""
 
-            # Parse dimensions
+            # Parse dimensions with one regex per part instead of a pile of
+            # split/strip/isdigit calls; non-numeric bounds fall back to 0
             dimensions = []
-            dim_parts = dims_str.split(',')
-            for dim in dim_parts:
-                dim = dim.strip()
-                if ':' in dim:
-                    parts = dim.split(':')
-                    lower = int(parts[0].strip()) if parts[0].strip().lstrip('-').isdigit() else 0
-                    upper = int(parts[1].strip()) if parts[1].strip().lstrip('-').isdigit() else 0
-                    dimensions.append((lower, upper))
+            for dim in dims_str.split(','):
+                dim_match = self._DIM_RE.match(dim)
+                lo_bound, colon, hi_bound = dim_match.group(1, 2, 3)
+                if colon:
+                    dimensions.append((int(lo_bound) if lo_bound else 0,
+                                       int(hi_bound) if hi_bound else 0))
                 else:
                     # Single bound means 0 to n or 1 to n
-                    upper = int(dim) if dim.isdigit() else 0
-                    dimensions.append((1, upper))
+                    dimensions.append((1, int(lo_bound) if lo_bound else 0))
 
             # Parse wordsize (W attribute)
             wordsize = None
-            w_match = re.search(r'W\s+(\d+)', attrs, re.IGNORECASE)
+            w_match = self._W_ATTR_RE.search(attrs_upper)
             if w_match:
                 wordsize = int(w_match.group(1))
 
             table = TableDefinition(
                 name=name,
                 dimensions=dimensions,
-                is_constant='CONSTANT' in attrs.upper(),
-                is_static='STATIC' in attrs.upper(),
-                is_parallel='PARALLEL' in attrs.upper(),
+                is_constant='CONSTANT' in attrs_upper,
+                is_static='STATIC' in attrs_upper,
+                is_parallel='PARALLEL' in attrs_upper,
                 wordsize=wordsize,
                 line_start=line_num,
             )
@@ -446,44 +816,39 @@ class JovialSemanticParser:
             self.model.add_table(table)
             self.current_table = name
 
-    def _parse_proc_declaration(self, statement: str, line_num: int):
+    def _parse_proc_declaration(self, statement: str, upper: str, line_num: int):
         """Parse PROC declaration"""
         # PROC name (params);
         # PROC name (in1, in2 : out1, out2);
 
         stmt = statement.rstrip(';').strip()
 
-        match = re.match(
-            r'PROC\s+([A-Z][A-Z0-9\']*)\s*'
-            r'(?:\(([^)]*)\))?\s*'
-            r'(.*)',
-            stmt, re.IGNORECASE
-        )
+        match = self._PROC_RE.match(upper.rstrip(';').strip())
 
         if match:
-            name = match.group(1)
-            params_str = match.group(2) or ""
-            rest = match.group(3) or ""
+            name = sys.intern(stmt[match.start(1):match.end(1)])
+            params_str = stmt[match.start(2):match.end(2)] if match.group(2) else ""
+            rest = stmt[match.start(3):] if match.group(3) else ""
 
             # Parse parameters (input : output)
             parameters = []
             if params_str:
                 if ':' in params_str:
-                    # Split into input and output sections
-                    in_out = params_str.split(':')
-                    inputs = [p.strip() for p in in_out[0].split(',') if p.strip()]
-                    outputs = [p.strip() for p in in_out[1].split(',') if p.strip()] if len(in_out) > 1 else []
+                    # Split into input and output sections at the first colon
+                    in_part, _, out_part = params_str.partition(':')
+                    inputs = [p.strip() for p in in_part.split(',') if p.strip()]
+                    outputs = [p.strip() for p in out_part.split(',') if p.strip()]
 
                     for p in inputs:
-                        parameters.append((p, 'IN'))
+                        parameters.append((sys.intern(p), 'IN'))
                     for p in outputs:
-                        parameters.append((p, 'OUT'))
+                        parameters.append((sys.intern(p), 'OUT'))
                 else:
                     # All parameters (mode determined by usage)
                     for p in params_str.split(','):
                         p = p.strip()
                         if p:
-                            parameters.append((p, 'INOUT'))
+                            parameters.append((sys.intern(p), 'INOUT'))
 
             proc = ProcDefinition(
                 name=name,
@@ -494,46 +859,40 @@ class JovialSemanticParser:
             self.model.add_proc(proc)
             self.current_proc = name
 
-    def _parse_type_declaration(self, statement: str, line_num: int):
+    def _parse_type_declaration(self, statement: str, upper: str, line_num: int):
         """Parse TYPE declaration"""
         # TYPE typename type-description;
         stmt = statement.rstrip(';').strip()
 
-        match = re.match(
-            r'TYPE\s+([A-Z][A-Z0-9\']*)\s+(.+)',
-            stmt, re.IGNORECASE
-        )
+        match = self._TYPE_RE.match(upper.rstrip(';').strip())
 
         if match:
-            name = match.group(1)
-            type_desc = match.group(2)
+            name = sys.intern(stmt[match.start(1):match.end(1)])
+            type_desc = stmt[match.start(2):match.end(2)]
             self.model.types[name] = {
                 'name': name,
                 'description': type_desc,
                 'line': line_num
             }
 
-    def _parse_define(self, statement: str, line_num: int):
+    def _parse_define(self, statement: str, upper: str, line_num: int):
         """Parse DEFINE constant"""
         # DEFINE name value;
         # DEFINE name = value;
         stmt = statement.rstrip(';').strip()
 
-        match = re.match(
-            r'DEFINE\s+([A-Z][A-Z0-9\']*)\s*=?\s*(.+)',
-            stmt, re.IGNORECASE
-        )
+        match = self._DEFINE_RE.match(upper.rstrip(';').strip())
 
         if match:
-            name = match.group(1)
-            value = match.group(2)
-            self.model.defines[name] = DefineConstant(
+            name = sys.intern(stmt[match.start(1):match.end(1)])
+            value = stmt[match.start(2):match.end(2)]
+            self.model.add_define(DefineConstant(
                 name=name,
                 value=value,
                 line_number=line_num
-            )
+            ))
 
-    def _parse_def_reference(self, statement: str, line_num: int):
+    def _parse_def_reference(self, statement: str, upper: str, line_num: int):
         """Parse DEF (import from COMPOOL)"""
         # DEF name;
         # DEF ITEM name;
@@ -541,14 +900,11 @@ class JovialSemanticParser:
         # DEF PROC name;
         stmt = statement.rstrip(';').strip()
 
-        match = re.match(
-            r'DEF\s+(ITEM|TABLE|PROC)?\s*([A-Z][A-Z0-9\']*)',
-            stmt, re.IGNORECASE
-        )
+        match = self._DEF_RE.match(upper.rstrip(';').strip())
 
         if match:
-            kind = match.group(1).upper() if match.group(1) else None
-            name = match.group(2)
+            kind = match.group(1)
+            name = sys.intern(stmt[match.start(2):match.end(2)])
 
             # Create placeholder for imported symbol
             if kind == 'ITEM' or kind is None:
@@ -559,19 +915,16 @@ class JovialSemanticParser:
                 )
                 self.model.add_item(item)
 
-    def _parse_ref_reference(self, statement: str, line_num: int):
+    def _parse_ref_reference(self, statement: str, upper: str, line_num: int):
         """Parse REF (reference to external)"""
         # REF PROC name;
         stmt = statement.rstrip(';').strip()
 
-        match = re.match(
-            r'REF\s+(ITEM|TABLE|PROC)?\s*([A-Z][A-Z0-9\']*)',
-            stmt, re.IGNORECASE
-        )
+        match = self._REF_RE.match(upper.rstrip(';').strip())
 
         if match:
-            kind = match.group(1).upper() if match.group(1) else 'PROC'
-            name = match.group(2)
+            kind = match.group(1) if match.group(1) else 'PROC'
+            name = sys.intern(stmt[match.start(2):match.end(2)])
 
             if kind == 'PROC':
                 proc = ProcDefinition(
@@ -612,42 +965,78 @@ class JovialSemanticParser:
         if line < 0 or line >= len(self.lines):
             return []
 
+        cache_key = (self.model.version, line, column)
+        cached = self._completion_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         current_line = self.lines[line]
         prefix = current_line[:column].strip().split()[-1] if current_line[:column].strip() else ""
         prefix = prefix.upper()
 
+        symbols = self.model.sorted_symbols()
+
+        if prefix:
+            # Slice the prefix range out of each presorted list with bisect
+            # rather than testing startswith on every entry
+            stop = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            lo = bisect.bisect_left(self.SORTED_KEYWORDS, prefix)
+            hi = bisect.bisect_left(self.SORTED_KEYWORDS, stop)
+            keywords = self.SORTED_KEYWORDS[lo:hi]
+            lo = bisect.bisect_left(symbols, prefix, key=str.upper)
+            hi = bisect.bisect_left(symbols, stop, key=str.upper)
+            symbols = symbols[lo:hi]
+        else:
+            keywords = self.SORTED_KEYWORDS
+
+        # Both streams are presorted, so a single merge pass with a
+        # duplicate skip replaces the sorted(set(...)) round trip
         completions = []
+        previous = None
+        for name in heapq.merge(keywords, symbols, key=str.upper):
+            if name != previous:
+                completions.append(name)
+                previous = name
 
-        # Add keywords
-        for kw in self.KEYWORDS:
-            if not prefix or kw.startswith(prefix):
-                completions.append(kw)
-
-        # Add symbols from model
-        for symbol in self.model.get_all_symbols():
-            if not prefix or symbol.upper().startswith(prefix):
-                completions.append(symbol)
-
-        return sorted(set(completions))
+        if len(self._completion_cache) >= self.POSITION_CACHE_SIZE:
+            self._completion_cache.clear()
+        self._completion_cache[cache_key] = completions
+        return completions
 
     def get_hover_info(self, line: int, column: int) -> Optional[Dict]:
         """Get hover information at a specific position"""
         if line < 0 or line >= len(self.lines):
             return None
 
-        current_line = self.lines[line]
+        cache_key = (self.model.version, line, column)
+        if cache_key in self._hover_cache:
+            return self._hover_cache[cache_key]
 
-        # Find word at position
-        word_match = None
-        for match in re.finditer(r"\b([A-Z][A-Z0-9']*)\b", current_line, re.IGNORECASE):
-            if match.start() <= column <= match.end():
-                word_match = match
-                break
+        info = self._hover_info_at(line, column)
+        if len(self._hover_cache) >= self.POSITION_CACHE_SIZE:
+            self._hover_cache.clear()
+        self._hover_cache[cache_key] = info
+        return info
 
-        if not word_match:
+    def _hover_info_at(self, line: int, column: int) -> Optional[Dict]:
+        """Compute hover information for get_hover_info's cache"""
+        current_line = self.lines[line]
+
+        # Find word at position by expanding around the cursor over
+        # identifier characters, instead of regex-scanning the whole line
+        column = min(column, len(current_line))
+        start = column
+        while start > 0 and (current_line[start - 1].isalnum() or current_line[start - 1] == "'"):
+            start -= 1
+        end = column
+        while end < len(current_line) and (current_line[end].isalnum() or current_line[end] == "'"):
+            end += 1
+
+        # Identifiers start with a letter, matching the [A-Z] rule
+        if start == end or not current_line[start].isalpha():
             return None
 
-        word = word_match.group(1).upper()
+        word = sys.intern(current_line[start:end].upper())
 
         # Check if it's an item
         item = self.model.get_item(word)
@@ -655,7 +1044,7 @@ class JovialSemanticParser:
             return {
                 'type': 'item',
                 'name': item.name,
-                'jovial_type': item.type.value,
+                'jovial_type': TYPE_STR[item.type],
                 'size': item.size,
                 'is_constant': item.is_constant,
                 'is_static': item.is_static,
@@ -702,47 +1091,7 @@ class JovialSemanticParser:
 
     def _get_keyword_description(self, keyword: str) -> str:
         """Get description for a J73 keyword"""
-        descriptions = {
-            'START': 'Begin main program module',
-            'TERM': 'End program module',
-            'BEGIN': 'Begin block',
-            'END': 'End block',
-            'COMPOOL': 'Communication pool module (shared data)',
-            'ITEM': 'Scalar variable declaration',
-            'TABLE': 'Array/structure declaration',
-            'PROC': 'Procedure declaration',
-            'TYPE': 'User-defined type declaration',
-            'DEFINE': 'Compile-time constant',
-            'DEF': 'Import from COMPOOL',
-            'REF': 'Reference to external',
-            'S': 'Signed integer type',
-            'U': 'Unsigned integer type',
-            'F': 'Floating-point type',
-            'A': 'Fixed-point (scaled) type',
-            'B': 'Bit string type',
-            'C': 'Character string type',
-            'P': 'Pointer type',
-            'STATUS': 'Enumeration type',
-            'STATIC': 'Static allocation (persistent)',
-            'CONSTANT': 'Read-only value',
-            'PARALLEL': 'Parallel allocation for bit-packing',
-            'IF': 'Conditional statement',
-            'FOR': 'Counted loop',
-            'WHILE': 'Conditional loop (test before)',
-            'UNTIL': 'Conditional loop (test after)',
-            'CASE': 'Multi-way branch',
-            'GOTO': 'Unconditional branch',
-            'RETURN': 'Return from procedure',
-            'EXIT': 'Exit from loop',
-            'ABORT': 'Abort program execution',
-            'LOC': 'Location (address) function',
-            'NEXT': 'Next value in sequence',
-            'BIT': 'Bit extraction function',
-            'BYTE': 'Byte extraction function',
-            'SHIFTL': 'Shift left',
-            'SHIFTR': 'Shift right',
-        }
-        return descriptions.get(keyword, f'J73 keyword: {keyword}')
+        return self._KEYWORD_DESCRIPTIONS.get(keyword, f'J73 keyword: {keyword}')
 
 
 # Example usage and test
@@ -791,7 +1140,7 @@ TERM
     print(f"\nItems ({len(model.items)}):")
     for name, item in model.items.items():
         if '.' not in name:  # Skip scoped duplicates
-            print(f"  {name}: {item.type.value} {item.size or ''}")
+            print(f"  {name}: {TYPE_STR[item.type]} {item.size or ''}")
             if item.status_values:
                 print(f"    Values: {item.status_values}")
 
@@ -800,7 +1149,7 @@ TERM
         dims = ', '.join([f"{d[0]}:{d[1]}" for d in table.dimensions])
         print(f"  {name} ({dims})")
         for entry_name, entry in table.entries.items():
-            print(f"    .{entry_name}: {entry.type.value}")
+            print(f"    .{entry_name}: {TYPE_STR[entry.type]}")
 
     print(f"\nProcs ({len(model.procs)}):")
     for name, proc in model.procs.items():